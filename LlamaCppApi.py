@@ -1,5 +1,36 @@
 import requests
 import json
+import hashlib
+from collections import OrderedDict
+
+class TokenCountCache:
+    """
+    LRU cache of token counts, keyed by server URL and a SHA-256
+    hash of the text so that long prompts are not kept in memory.
+
+    :param max_entries: The maximum number of counts to keep before evicting
+                        the least recently used entry.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def key(base_url: str, text: str):
+        return (base_url, hashlib.sha256(text.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, count: int):
+        self._entries[key] = count
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
 
 class LlamaCppApi:
     """
@@ -10,6 +41,13 @@ class LlamaCppApi:
     :param base_url: The base URL of the NLP server API.
     :param api_key: An optional API key for authentication with the server.
     """
+
+    # Shared across clients, as nodes create a new client for every call.
+    # ComfyUI executes nodes on a single worker thread, so none of these
+    # are locked.
+    session = requests.Session()
+    token_count_cache = TokenCountCache()
+    _context_sizes = {}
     
     def __init__(self, base_url: str, api_key: str = None):
         self.base_url = base_url
@@ -31,7 +69,7 @@ class LlamaCppApi:
         """
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = requests.request(method, url, headers=self.headers, json=data, params=params, stream=stream)
+            response = self.session.request(method, url, headers=self.headers, json=data, params=params, stream=stream)
             response.raise_for_status()
             
             if stream:
@@ -82,6 +120,60 @@ class LlamaCppApi:
         """
         return self._send_request('post', 'embedding', data={"content": content, **options})
 
+    def get_props(self, options: dict = {}):
+        """
+        Requests the server properties, including the context size.
+
+        :param options: Additional options for the props request.
+        :return: Server properties as a JSON object.
+        """
+        return self._send_request('get', 'props', params=options)
+
+    def get_context_size(self):
+        """
+        Returns the context size (n_ctx) of the server. The value is read from
+        /props once per server URL and reused afterwards.
+
+        :return: The context size, or None if it could not be determined.
+        """
+        if self.base_url in LlamaCppApi._context_sizes:
+            return LlamaCppApi._context_sizes[self.base_url]
+
+        response = self.get_props()
+        if not response or response.status_code != 200:
+            return None
+
+        props = response.json()
+        n_ctx = props.get('n_ctx') or props.get('default_generation_settings', {}).get('n_ctx')
+        if n_ctx:
+            LlamaCppApi._context_sizes[self.base_url] = n_ctx
+        return n_ctx
+
+    def count_tokens(self, text: str):
+        """
+        Counts the tokens of a text, using the shared token count cache. Counts
+        include the BOS token, matching how /completion tokenizes a prompt.
+
+        :param text: The text to count tokens for.
+        :return: The token count, or None on failure.
+        """
+        key = TokenCountCache.key(self.base_url, text)
+        count = self.token_count_cache.get(key)
+        if count is not None:
+            return count
+
+        # /tokenize defaults add_special to false, /completion adds BOS
+        response = self.post_tokenize(text, {"add_special": True})
+        if not response or response.status_code != 200:
+            return None
+        tokens = response.json().get('tokens')
+        if tokens is None:
+            return None
+
+        count = len(tokens)
+        self.token_count_cache.put(key, count)
+        return count
+
     def get_health(self, options: dict = {}):
         """
         Checks the health of the server.
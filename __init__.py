@@ -1,6 +1,6 @@
 # __init__.py
 
-from .llama_node import LlamaNode, TextInputNode, TextOutputNode, ChunkInputNode, LoopController, IntegerComparisonNode, RegexMatchNode, ConditionalRouterNode, TextSplitterNode, ImageLoaderNode, TextFindReplaceNode
+from .llama_node import LlamaNode, TextInputNode, TextOutputNode, ChunkInputNode, LoopController, IntegerComparisonNode, RegexMatchNode, ConditionalRouterNode, TextSplitterNode, ImageLoaderNode, TextFindReplaceNode, TokenCountNode, TokenizeNode, DetokenizeNode
 
 # A dictionary that contains all nodes you want to export with their names
 # NOTE: names should be globally unique
@@ -15,7 +15,10 @@ NODE_CLASS_MAPPINGS = {
     "ConditionalRouterNode": ConditionalRouterNode,
     "TextSplitterNode": TextSplitterNode,
     "ImageLoaderNode": ImageLoaderNode,
-    "TextFindReplaceNode": TextFindReplaceNode
+    "TextFindReplaceNode": TextFindReplaceNode,
+    "TokenCountNode": TokenCountNode,
+    "TokenizeNode": TokenizeNode,
+    "DetokenizeNode": DetokenizeNode
 }
 
 # A dictionary that contains the friendly/humanly readable titles for the nodes
@@ -30,5 +33,8 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "ConditionalRouterNode": "Conditional Router",
     "TextSplitterNode": "Text Splitter",
     "ImageLoaderNode": "Image Loader",
-    "TextFindReplaceNode": "Text Find & Replace"
+    "TextFindReplaceNode": "Text Find & Replace",
+    "TokenCountNode": "Token Count",
+    "TokenizeNode": "Tokenize",
+    "DetokenizeNode": "Detokenize"
 }
@@ -159,6 +159,9 @@ class LlamaNode:
                         "min": 0, 
                         "max": 0xffffffffffffffff
                 })
+            },
+            "optional": {
+                "auto_max_tokens": ("BOOLEAN", {"default": False}),
             }
         }
 
@@ -168,12 +171,18 @@ class LlamaNode:
 
     CATEGORY = "LlamaApi"
 
-    def get_completion(self, prompt, api_url, temperature, sys_prefix, stop, max_tokens, seed):
+    def get_completion(self, prompt, api_url, temperature, sys_prefix, stop, max_tokens, seed, auto_max_tokens=False):
         try:
             print("Call request", api_url)
             client = LlamaCppApi(base_url=api_url)
 
-            full_prompt = f"<s>[INST] {sys_prefix}\n\n{prompt} [/INST]"
+            full_prompt = self.build_prompt(sys_prefix, prompt)
+            if auto_max_tokens:
+                max_tokens = self.get_token_budget(client, full_prompt, max_tokens)
+                if max_tokens is None:
+                    print("Error: Prompt does not fit in the context window")
+                    return ("Bad Panda",)
+
             options = {
                 "temperature": temperature,
                 "n_predict": max_tokens,
@@ -198,6 +207,142 @@ class LlamaNode:
             print(error_message)
             return ("Bad Panda",)
 
+    @staticmethod
+    def build_prompt(sys_prefix, prompt):
+        return f"<s>[INST] {sys_prefix}\n\n{prompt} [/INST]"
+
+    @staticmethod
+    def get_token_budget(client, full_prompt, max_tokens):
+        # n_predict = n_ctx - prompt tokens, capped by max_tokens unless it is -1.
+        # Returns None if the prompt leaves no room in the context window.
+        n_ctx = client.get_context_size()
+        prompt_tokens = client.count_tokens(full_prompt)
+        if n_ctx is None or prompt_tokens is None:
+            print("Token budget unavailable, using max_tokens")
+            return max_tokens
+
+        budget = n_ctx - prompt_tokens
+        if budget <= 0:
+            print(f"Prompt uses {prompt_tokens} tokens, n_ctx is {n_ctx}")
+            return None
+        if max_tokens >= 0:
+            budget = min(budget, max_tokens)
+        print(f"Token budget: {budget} ({prompt_tokens} prompt tokens, n_ctx {n_ctx})")
+        return budget
+
+class TokenCountNode:
+    # With use_prompt_template the text is wrapped the same way LlamaNode wraps
+    # its prompt, so remaining_tokens matches the auto_max_tokens budget.
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "text": ("STRING", {"multiline": True}),
+                "api_url": ("STRING", {
+                    "multiline": False,
+                    "default": "http://127.0.0.1:8080"
+                }),
+            },
+            "optional": {
+                "use_prompt_template": ("BOOLEAN", {"default": False}),
+                "sys_prefix": ("STRING", {"multiline": True, "default": ""}),
+            }
+        }
+
+    RETURN_TYPES = ("INT", "INT", "INT")
+    RETURN_NAMES = ("token_count", "remaining_tokens", "context_size")
+    FUNCTION = "count_tokens"
+    CATEGORY = "LlamaApi"
+
+    def count_tokens(self, text, api_url, use_prompt_template=False, sys_prefix=""):
+        # -1 marks an unknown value, as max_tokens=-1 does
+        try:
+            if use_prompt_template:
+                text = LlamaNode.build_prompt(sys_prefix, text)
+
+            client = LlamaCppApi(base_url=api_url)
+            token_count = client.count_tokens(text)
+            if token_count is None:
+                print(f"Error: Unable to tokenize text using {api_url}")
+                return (-1, -1, -1)
+
+            n_ctx = client.get_context_size()
+            if n_ctx is None:
+                print(f"Error: Unable to read context size from {api_url}")
+                return (token_count, -1, -1)
+
+            remaining_tokens = max(n_ctx - token_count, 0)
+            return (token_count, remaining_tokens, n_ctx)
+
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return (-1, -1, -1)
+
+class TokenizeNode:
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "text": ("STRING", {"multiline": True}),
+                "api_url": ("STRING", {
+                    "multiline": False,
+                    "default": "http://127.0.0.1:8080"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "INT")
+    RETURN_NAMES = ("tokens", "token_count")
+    FUNCTION = "tokenize"
+    CATEGORY = "LlamaApi"
+
+    def tokenize(self, text, api_url):
+        # Tokens are returned comma separated, the format DetokenizeNode reads
+        try:
+            client = LlamaCppApi(base_url=api_url)
+            response = client.post_tokenize(text)
+            if response and response.status_code == 200:
+                tokens = response.json().get('tokens')
+                if tokens is not None:
+                    return (", ".join(str(token) for token in tokens), len(tokens))
+            print(f"Error: Unable to tokenize text using {api_url}")
+            return ("", -1)
+
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return ("", -1)
+
+class DetokenizeNode:
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "tokens": ("STRING", {"multiline": True, "default": ""}),
+                "api_url": ("STRING", {
+                    "multiline": False,
+                    "default": "http://127.0.0.1:8080"
+                }),
+            }
+        }
+
+    RETURN_TYPES = ("STRING",)
+    FUNCTION = "detokenize"
+    CATEGORY = "LlamaApi"
+
+    def detokenize(self, tokens, api_url):
+        try:
+            token_ids = [int(token) for token in re.findall(r'\d+', tokens)]
+            client = LlamaCppApi(base_url=api_url)
+            response = client.post_detokenize(token_ids)
+            if response and response.status_code == 200:
+                return (response.json().get('content', ''),)
+            print(f"Error: Unable to detokenize tokens using {api_url}")
+            return ("",)
+
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            return ("",)
+
 class LoopController:
     current_iteration = 0
 
@@ -492,4 +637,7 @@ class TextCleanerNode:
 
 NODE_CLASS_MAPPINGS["TextCleanerNode"] = TextCleanerNode
 NODE_CLASS_MAPPINGS["TextFindReplaceNode"] = TextFindReplaceNode
+NODE_CLASS_MAPPINGS["TokenCountNode"] = TokenCountNode
+NODE_CLASS_MAPPINGS["TokenizeNode"] = TokenizeNode
+NODE_CLASS_MAPPINGS["DetokenizeNode"] = DetokenizeNode
 